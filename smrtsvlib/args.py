@@ -1,8 +1,26 @@
 """
 Defines a dictionary of command-line options.
+
+Each option specification is built the first time it is requested from `args_dict` instead of when this module is
+imported. Specifications are kept as source instead of a serialized blob: `marshal` cannot store the `type` callables
+they contain, and the compiled module is already cached as bytecode by Python.
 """
 
-args_dict = dict()
+import functools
+
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# Marks a missing attribute in `get_arg()`
+_SENTINEL = object()
+
+# Shared option specification parts
+_STORE_TRUE = MappingProxyType({'action': 'store_true'})
+_STORE_TRUE_DEFAULT_FALSE = MappingProxyType({'action': 'store_true', 'default': False})
+
+_GT_MAP_JOBS = 'to allocate for BWA mapping jobs.'
+
+_arg_specs = dict()
 
 
 ###########
@@ -13,76 +31,74 @@ args_dict = dict()
 # Option to the base parser
 #
 
-args_dict['cluster_config'] = {
+_arg_specs['cluster_config'] = lambda: {
     'help': 'JSON/YAML file specifying cluster configuration parameters to pass to Snakemake\'s '
             '--cluster-config option'
 }
 
-args_dict['distribute'] = {
-    'action': 'store_true',
+_arg_specs['distribute'] = lambda: {
+    **_STORE_TRUE,
     'help': 'Distribute analysis to Grid Engine-style cluster.'
 }
 
-args_dict['drmaalib'] = {
+_arg_specs['drmaalib'] = lambda: {
     'help': 'For jobs that are distributed, this is the location to the DRMAA library (libdrmaa.so) '
             'installed with Grid Engine. If DRMAA_LIBRARY_PATH is already set in the environment, '
             'then this option is not required.'
 }
 
-args_dict['dryrun'] = {
-    'action': 'store_true',
+_arg_specs['dryrun'] = lambda: {
+    **_STORE_TRUE,
     'help': 'Print commands that will run without running them.'
 }
 
-args_dict['jobs'] = {
+_arg_specs['jobs'] = lambda: {
     'type': int,
     'default': 1,
     'help': 'Number of jobs to run simultaneously.'
 }
 
-args_dict['job_prefix'] = {
+_arg_specs['job_prefix'] = lambda: {
     'default': None,
     'help': 'Prepend this string to submitted job names. Can be used to distinguish jobs from multiple runs.'
 }
 
-args_dict['keep_going'] = {
-    'action': 'store_true',
-    'default': False,
+_arg_specs['keep_going'] = lambda: {
+    **_STORE_TRUE_DEFAULT_FALSE,
     'help': 'When a step in a Snakemake pipeline fails, do not stop the pipeline. This will cause Snakemake '
             'to continue submitting new jobs until it cannot continue.'
 }
 
-args_dict['log'] = {
+_arg_specs['log'] = lambda: {
     'help': 'Cluster log file directory for distributed jobs. Each SMRT-SV command defaults to a log directory in its '
             'output subdirectory. The genotyper will use "log" in its working directory. If this value is set, all '
             'logs from all commands are written to the specified directory.'
 }
 
-args_dict['nt'] = {
-    'action': 'store_true',
-    'default': False,
+_arg_specs['nt'] = lambda: {
+    **_STORE_TRUE_DEFAULT_FALSE,
     'help': 'Do not remove temporary files. This option may leave behind many unwanted files including all '
             'intermediate local assembly files.'
 }
 
-args_dict['tempdir'] = {
+_arg_specs['tempdir'] = lambda: {
     'default': None,
     'help': 'Temporary directory.'
 }
 
-args_dict['verbose'] = {
-    'action': 'store_true',
+_arg_specs['verbose'] = lambda: {
+    **_STORE_TRUE,
     'help': 'Print extra runtime information.'
 }
 
-args_dict['wait_time'] = {
+_arg_specs['wait_time'] = lambda: {
     'type': int,
     'default': 60,
     'help': 'Number of seconds to wait for files after a jobs finishes before giving up. Set to a high value for'
             'distributed storage with high latency.'
 }
 
-args_dict['cluster_params'] = {
+_arg_specs['cluster_params'] = lambda: {
     'default': ' -V -cwd -j y -o ./{log} '
                '-pe serial {{cluster.cpu}} '
                '-l mfree={{cluster.mem}} '
@@ -101,7 +117,7 @@ args_dict['cluster_params'] = {
 #
 
 # mapping_quality
-args_dict['mapping_quality'] = {
+_arg_specs['mapping_quality'] = lambda: {
     'type': int,
     'default': 30,
     'help': 'Minimum mapping quality of raw reads. Used by "detect" to filter reads while finding gaps and hardstops. '
@@ -114,12 +130,12 @@ args_dict['mapping_quality'] = {
 #
 
 # reference
-args_dict['reference'] = {
+_arg_specs['reference'] = lambda: {
     'default': None,
     'help': 'FASTA file of reference to index.',
 }
 
-args_dict['no_link_index'] = {
+_arg_specs['no_link_index'] = lambda: {
     'dest': 'link_index',
     'action': 'store_false',
     'default': True,
@@ -133,7 +149,7 @@ args_dict['no_link_index'] = {
 #
 
 # alignment_parameters
-args_dict['alignment_parameters'] = {
+_arg_specs['alignment_parameters'] = lambda: {
     'default':
         '--bestn 2 '
         '--maxAnchorsPerPosition 100 '
@@ -149,21 +165,21 @@ args_dict['alignment_parameters'] = {
 }
 
 # batches
-args_dict['batches'] = {
+_arg_specs['batches'] = lambda: {
     'type': int,
     'default': 20,
     'help': 'number of batches to split input reads into such that there will be one BAM output file per batch'
 }
 
 # reads
-args_dict['reads'] = {
+_arg_specs['reads'] = lambda: {
     'default': '',
     'help': 'Text file with each line containing an absolute path to an input file of read data. Read data must be'
             'from PacBio sequencing technology and be in BAM (.bam) or BAX (.bax.h5) format.'
 }
 
 # threads
-args_dict['threads'] = {
+_arg_specs['threads'] = lambda: {
     'help': 'Number of threads to use for each alignment job.',
     'type': int,
     'default': 1
@@ -175,7 +191,7 @@ args_dict['threads'] = {
 #
 
 # assembly_window_size
-args_dict['assembly_window_size'] = {
+_arg_specs['assembly_window_size'] = lambda: {
     'type': int,
     'default': 60000,
     'help': 'size of reference window for local assemblies.'
@@ -183,13 +199,13 @@ args_dict['assembly_window_size'] = {
 }
 
 # assembly_window_slide
-args_dict['assembly_window_slide'] = {
+_arg_specs['assembly_window_slide'] = lambda: {
     'type': int,
     'default': 20000,
     'help': 'size of reference window slide for local assemblies.',
 }
 
-args_dict['candidate_group_size'] = {
+_arg_specs['candidate_group_size'] = lambda: {
     'type': int,
     'default': int(1e6),
     'help': 'Candidate regions are grouped into batches of this size. When local assemblies are performed, '
@@ -199,55 +215,55 @@ args_dict['candidate_group_size'] = {
 }
 
 # exclude
-args_dict['exclude'] = {
+_arg_specs['exclude'] = lambda: {
     'default': None,
     'help': 'BED file of regions to exclude from local assembly (e.g., heterochromatic sequences, etc.).'
 }
 
 # max_candidate_length
-args_dict['max_candidate_length'] = {
+_arg_specs['max_candidate_length'] = lambda: {
     'type': int,
     'default': 60000,
     'help': 'Maximum length allowed for an SV candidate region.'
 }
 
 # max_coverage
-args_dict['max_coverage'] = {
+_arg_specs['max_coverage'] = lambda: {
     'type': int,
     'default': 100,
     'help': 'Maximum number of total reads allowed to flag a region as an SV candidate.'
 }
 
 # max_support
-args_dict['max_support'] = {
+_arg_specs['max_support'] = lambda: {
     'type': int,
     'default': 100,
     'help': 'Maximum number of supporting reads allowed to flag a region as an SV candidate.'
 }
 
 # min_coverage
-args_dict['min_coverage'] = {
+_arg_specs['min_coverage'] = lambda: {
     'type': int,
     'default': 5,
     'help': 'Minimum number of total reads required to flag a region as an SV candidate.'
 }
 
 # min_hardstop_support
-args_dict['min_hardstop_support'] = {
+_arg_specs['min_hardstop_support'] = lambda: {
     'type': int,
     'default': 11,
     'help': 'Minimum number of reads with hardstops required to flag a region as an SV candidate.'
 }
 
 # min_length
-args_dict['min_length'] = {
+_arg_specs['min_length'] = lambda: {
     'type': int,
     'default': 50,
     'help': 'Minimum length required for SV candidates.'
 }
 
 # min_support
-args_dict['min_support'] = {
+_arg_specs['min_support'] = lambda: {
     'type': int,
     'default': 5,
     'help': 'Minimum number of supporting reads required to flag a region as an SV candidate.'
@@ -259,7 +275,7 @@ args_dict['min_support'] = {
 #
 
 # asm_alignment_parameters
-args_dict['asm_alignment_parameters'] = {
+_arg_specs['asm_alignment_parameters'] = lambda: {
     'default':
         '--affineAlign '
         '--affineOpen 8 '
@@ -271,14 +287,14 @@ args_dict['asm_alignment_parameters'] = {
 }
 
 # asm_cpu
-args_dict['asm_cpu'] = {
+_arg_specs['asm_cpu'] = lambda: {
     'type': int,
     'default': 4,
     'help': 'Number of CPUs to use for assembly steps.'
 }
 
 # asm_mem
-args_dict['asm_mem'] = {
+_arg_specs['asm_mem'] = lambda: {
     'default': '1G',
     'help':
         'Multiply this amount of memory by the number of cores for the amount of memory allocated to assembly steps.'
@@ -286,7 +302,7 @@ args_dict['asm_mem'] = {
 }
 
 # asm_polish
-args_dict['asm_polish'] = {
+_arg_specs['asm_polish'] = lambda: {
     'default': 'arrow',
     'help':
         'Assembly polishing method (arrow|quiver). "arrow" should work on all PacBio data, but "quiver" will only '
@@ -294,14 +310,14 @@ args_dict['asm_polish'] = {
 }
 
 # asm_group_rt
-args_dict['asm_group_rt'] = {
+_arg_specs['asm_group_rt'] = lambda: {
     'default': '72:00:00',
     'help':
         'Set maximum runtime for an assembly group. Assemblies are grouped by region, and multiple assemblies are done '
         'in one grouped job. This is the maximum runtime for the whole group.'
 }
 
-args_dict['asm_parallel'] = {
+_arg_specs['asm_parallel'] = lambda: {
     'type': int,
     'default': 1,
     'help':
@@ -309,7 +325,7 @@ args_dict['asm_parallel'] = {
 }
 
 # asm_group_rt
-args_dict['asm_rt'] = {
+_arg_specs['asm_rt'] = lambda: {
     'default': '30m',
     'help':
         'Set maximum runtime for an assembly region. This should be a valid argument for the Linux "timeout" command.'
@@ -321,29 +337,28 @@ args_dict['asm_rt'] = {
 #
 
 # variants
-args_dict['variants'] = {
+_arg_specs['variants'] = lambda: {
     'default': 'variants.vcf.gz',
     'help': 'VCF of variants called by local assembly alignments.',
     'nargs': '?'
 }
 
 # sample
-args_dict['sample'] = {
+_arg_specs['sample'] = lambda: {
     'default': 'UnnamedSample',
     'help': 'Sample name to use in final variant calls'
 }
 
 # species
-args_dict['species'] = {
+_arg_specs['species'] = lambda: {
     'default': 'human',
     'help': 'Common or scientific species name to pass to RepeatMasker.'
 }
 
 # rmsk
-args_dict['rmsk'] = {
+_arg_specs['rmsk'] = lambda: {
     'dest': 'rmsk',
-    'action': 'store_true',
-    'default': False,
+    **_STORE_TRUE_DEFAULT_FALSE,
     'help': 'Run RepeatMasker on SVs. This option was developed using RepeatMasker 3.3.0 with the WU-BLAST engine. '
             'With other versions, it may not run smoothly or it may cause failures in later steps.'
 }
@@ -354,7 +369,7 @@ args_dict['rmsk'] = {
 #
 
 # runjobs
-args_dict['runjobs'] = {
+_arg_specs['runjobs'] = lambda: {
     'help':
         'A comma-separated list of jobs for each step: align, detect, assemble, and call (in that order). A missing '
         'number uses the value set by --jobs (or 1 if --jobs was not set).',
@@ -367,93 +382,195 @@ args_dict['runjobs'] = {
 #
 
 # genotyper_config
-args_dict['genotyper_config'] = {
+_arg_specs['genotyper_config'] = lambda: {
     'help':
         'JSON configuration file with SV reference paths, samples to genotype as BAMs, '
         'and their corresponding references.'
 }
 
-args_dict['gt_mapq'] = {
+_arg_specs['gt_mapq'] = lambda: {
     'type': int,
     'default': 20,
     'help': 'Minimum mapping quality of short reads against the reference and contigs.'
 }
 
 # genotyped_variants
-args_dict['genotyped_variants'] = {
+_arg_specs['genotyped_variants'] = lambda: {
     'help': 'VCF of SMRT SV variant genotypes for the given sample-level BAMs.'
 }
 
 # CPU cores for BWA mapping jobs
-args_dict['gt_map_cpu'] = {
+_arg_specs['gt_map_cpu'] = lambda: {
     'type': int,
     'default': 8,
-    'help': 'Memory per CPU core to allocate for BWA mapping jobs.'
+    'help': 'Memory per CPU core ' + _GT_MAP_JOBS
 }
 
 # Memory per CPU core for BWA mapping jobs
-args_dict['gt_map_mem'] = {
+_arg_specs['gt_map_mem'] = lambda: {
     'default': '2.5G',
-    'help': 'Memory per CPU core to allocate for BWA mapping jobs.'
+    'help': 'Memory per CPU core ' + _GT_MAP_JOBS
 }
 
-args_dict['gt_map_disk'] = {
+_arg_specs['gt_map_disk'] = lambda: {
     'default': '15G',
-    'help': 'Temp space per CPU Core to allocate for BWA mapping jobs.'
+    'help': 'Temp space per CPU Core ' + _GT_MAP_JOBS
 }
 
-args_dict['gt_map_time'] = {
+_arg_specs['gt_map_time'] = lambda: {
     'default': '72:00:00',
-    'help': 'Maximum runtime to allocate for BWA mapping jobs.'
+    'help': 'Maximum runtime ' + _GT_MAP_JOBS
 }
 
 # Keep temp files
-args_dict['gt_keep_temp'] = {
-    'action': 'store_true',
+_arg_specs['gt_keep_temp'] = lambda: {
+    **_STORE_TRUE,
     'help': 'Do not remove temp directory after genotyping.'
 }
 
 
+##############
+# Dictionary #
+##############
+
+@functools.lru_cache(maxsize=None)
+def _build(key):
+    """
+    Build the option specification for `key`.
+
+    :param key: Argument key (name).
+
+    :return: Dictionary of keyword arguments for `argparse.ArgumentParser.add_argument()`.
+
+    Raises:
+        KeyError: If `key` is not a built-in argument.
+    """
+    return _arg_specs[key]()
+
+
+class LazyArgDict(Mapping):
+    """
+    Read-only mapping of argument keys to option specifications. Specifications are built on first lookup and cached.
+    """
+
+    def __getitem__(self, key):
+        return _build(key)
+
+    def __contains__(self, key):
+        return key in _arg_specs
+
+    def __iter__(self):
+        return iter(_arg_specs)
+
+    def __len__(self):
+        return len(_arg_specs)
+
+
+args_dict = LazyArgDict()
+
+# Marks an argument without a hard-coded default value
+_NO_DEFAULT = object()
+
+# Resolved hard-coded default values (or _NO_DEFAULT) by argument key, filled on first lookup
+_DEFAULTS = dict()
+
+
 #############
 # Functions #
 #############
 
-def get_arg(key, args=None, default=None, default_none=False):
+def _resolve_default(key):
     """
-    Get an argument from object `args` or the default value for an argument if it is not in `args`.
+    Get the hard-coded default value for an argument.
 
     :param key: Argument key (name).
-    :param args: Argument object or `None` to always get the default argument.
-    :param default: Default value if not in `args`. Uses hard-coded default if `None`.
-    :param default_none: If `True` and there is no default argument, return `None` instead of throwing an error.
 
-    :return: Argument value.
+    :return: Default value or `_NO_DEFAULT` if the argument has no default value.
 
     Raises:
-        KeyError: If `key` is not in `args` and does not have a default value.
+        KeyError: If `key` is not in the built-in argument dictionary.
     """
 
-    # Get argument from args
-    if args is not None and hasattr(args, key):
-        return getattr(args, key)
-
-    # Get explicit default value
-    if default is not None:
-        return default
-
-    # Get hard-coded default value
     if key not in args_dict:
-        raise KeyError('No record for argument with key {} in built-in argument dictionary'.format(key))
+        raise KeyError(f'No record for argument with key {key} in built-in argument dictionary')
 
-    if 'default' in args_dict[key]:
-        return args_dict[key]['default']
+    spec = args_dict[key]
 
-    if 'action' in args_dict[key] and args_dict[key]['action'] == 'store_true':
+    if 'default' in spec:
+        return spec['default']
+
+    if spec.get('action') == 'store_true':
         # 'action' entries have an implicit default of False
         return False
 
-    # No value, no default
-    if default_none:
-        return None
+    return _NO_DEFAULT
+
+
+def _clear_cache():
+    """
+    Clear cached option specifications and default values. Must be called after the built-in argument specifications
+    are modified.
+    """
+    _build.cache_clear()
+    _DEFAULTS.clear()
+
+
+def _make_get_arg():
+    """
+    Create `get_arg()` with module-level names bound as closure variables so each call avoids global lookups.
+    `_DEFAULTS` is only ever modified in place, so the bound methods remain valid.
+
+    :return: `get_arg()` function.
+    """
+
+    sentinel = _SENTINEL
+    no_default = _NO_DEFAULT
+    defaults = _DEFAULTS
+    defaults_get = _DEFAULTS.get
+    resolve_default = _resolve_default
+
+    def get_arg(key, args=None, default=None, default_none=False):
+        """
+        Get an argument from object `args` or the default value for an argument if it is not in `args`.
+
+        :param key: Argument key (name).
+        :param args: Argument object or `None` to always get the default argument.
+        :param default: Default value if not in `args`. Uses hard-coded default if `None`.
+        :param default_none: If `True` and there is no default argument, return `None` instead of throwing an error.
+
+        :return: Argument value.
+
+        Raises:
+            KeyError: If `key` is not in `args` and does not have a default value.
+        """
+
+        # Get argument from args
+        if args is not None:
+            val = getattr(args, key, sentinel)
+
+            if val is not sentinel:
+                return val
+
+        # Get explicit default value
+        if default is not None:
+            return default
+
+        # Get hard-coded default value
+        val = defaults_get(key, sentinel)
+
+        if val is sentinel:
+            val = defaults[key] = resolve_default(key)
+
+        if val is not no_default:
+            return val
+
+        # No value, no default
+        if default_none:
+            return None
+
+        raise KeyError(f'No default value for argument with key {key}')
+
+    return get_arg
+
 
-    raise KeyError('No default value for argument with key {}'.format(key))
+get_arg = _make_get_arg()